@@ -19,7 +19,11 @@ EXAMPLES:
     python3 usage_analyzer.py data.json --days 7 --correlations
 
 REQUIREMENTS:
-    - Python 3.6+
+    - Python 3.7+
+    - Optional: orjson (pip install orjson) for faster loading of large exports
+    - Optional: ijson (pip install ijson) to stream large exports with --days
+    - Also runs under PyPy (pypy3 usage_analyzer.py ...), which uses the
+      pure-Python stdlib path and is usually fastest on very large exports
     - JSON file exported from FastSwitch (Menu → Reportes → Exportar Datos)
 
 OUTPUT:
@@ -35,24 +39,122 @@ OUTPUT:
 """
 
 import json
+import platform
 import sys
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict
+from functools import lru_cache
 import argparse
 
+# C-extension accelerators only help on CPython; PyPy's JIT handles the
+# stdlib json module and plain loops well on its own.
+IS_PYPY = platform.python_implementation() == 'PyPy'
+
+orjson = None
+ijson = None
+if not IS_PYPY:
+    try:
+        import orjson
+    except ImportError:
+        pass
+    
+    try:
+        import ijson
+    except ImportError:
+        pass
+
+INVALID_JSON_ERRORS = (json.JSONDecodeError,)
+if ijson is not None:
+    INVALID_JSON_ERRORS += (ijson.JSONError,)
+
+def load_export(path):
+    """Load an exported JSON file, using orjson when available"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def load_recent_days(path, since):
+    """Load only the dailyData entries dated on or after `since` (YYYY-MM-DD)
+
+    With ijson installed, days are streamed and older entries are never
+    materialized; otherwise the whole export is loaded and then filtered.
+    ISO date keys compare correctly as strings.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            return {
+                date_str: day_data for date_str, day_data in ijson.kvitems(f, 'dailyData', use_float=True)
+                if date_str >= since
+            }
+    daily_data = load_export(path).get('dailyData', {})
+    return {date_str: day_data for date_str, day_data in daily_data.items() if date_str >= since}
+
 def parse_date(date_str):
     """Parse ISO date string to datetime object"""
     return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
 
 def format_duration(seconds):
     """Format duration in seconds to human readable format"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
+    return _format_whole_seconds(int(seconds))
+
+@lru_cache(maxsize=512)
+def _format_whole_seconds(seconds):
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
     if hours > 0:
         return f"{hours}h {minutes}m"
     else:
         return f"{minutes}m"
 
+def aggregate_daily_data(daily_data, track_weekly=True):
+    """Reduce dailyData to usage totals in a single pass
+
+    Returns session/break/call totals, merged app usage, deep focus and
+    continuous sessions, and per-weekday session totals and day counts
+    (indexed by date.weekday()) when track_weekly is set.
+    """
+    total_session_time = 0
+    total_break_time = 0
+    total_call_time = 0
+    app_usage = Counter()
+    deep_focus_sessions = []
+    continuous_sessions = []
+    weekly_totals = [0.0] * 7
+    weekly_counts = [0] * 7
+    add_deep_focus = deep_focus_sessions.extend
+    add_continuous = continuous_sessions.extend
+    
+    for date_str, day in daily_data.items():
+        session_time = day['totalSessionTime']
+        total_session_time += session_time
+        total_break_time += day['totalBreakTime']
+        total_call_time += day['callTime']
+        
+        apps = day.get('appUsage')
+        if apps:
+            app_usage.update(apps)  # Adds per-app times
+        
+        add_deep_focus(day.get('deepFocusSessions') or ())
+        add_continuous(day.get('continuousWorkSessions') or ())
+        
+        if track_weekly:
+            weekday = date.fromisoformat(date_str).weekday()
+            weekly_totals[weekday] += session_time
+            weekly_counts[weekday] += 1
+    
+    return {
+        'total_session_time': total_session_time,
+        'total_break_time': total_break_time,
+        'total_call_time': total_call_time,
+        'app_usage': app_usage,
+        'deep_focus_sessions': deep_focus_sessions,
+        'continuous_sessions': continuous_sessions,
+        'weekly_totals': weekly_totals,
+        'weekly_counts': weekly_counts
+    }
+
 def analyze_usage_data(data):
     """Analyze the usage data and generate insights"""
     daily_data = data.get('dailyData', {})
@@ -64,11 +166,17 @@ def analyze_usage_data(data):
     print("📊 FastSwitch Usage Analysis")
     print("=" * 50)
     
-    # Basic statistics
     total_days = len(daily_data)
-    total_session_time = sum(day['totalSessionTime'] for day in daily_data.values())
-    total_break_time = sum(day['totalBreakTime'] for day in daily_data.values())
-    total_call_time = sum(day['callTime'] for day in daily_data.values())
+    track_weekly = total_days >= 7
+    totals = aggregate_daily_data(daily_data, track_weekly)
+    total_session_time = totals['total_session_time']
+    total_break_time = totals['total_break_time']
+    total_call_time = totals['total_call_time']
+    app_usage = totals['app_usage']
+    deep_focus_sessions = totals['deep_focus_sessions']
+    continuous_sessions = totals['continuous_sessions']
+    weekly_totals = totals['weekly_totals']
+    weekly_counts = totals['weekly_counts']
     
     print(f"\n📅 Data Range: {total_days} days")
     print(f"⏰ Total Work Time: {format_duration(total_session_time)}")
@@ -80,25 +188,16 @@ def analyze_usage_data(data):
         print(f"📈 Average Daily Work: {format_duration(avg_daily_work)}")
     
     # App usage analysis
-    app_usage = defaultdict(float)
-    for day in daily_data.values():
-        for app, time in day.get('appUsage', {}).items():
-            app_usage[app] += time
-    
     if app_usage:
         print(f"\n📱 Top Applications:")
-        sorted_apps = sorted(app_usage.items(), key=lambda x: x[1], reverse=True)
-        for i, (app, time) in enumerate(sorted_apps[:10], 1):
+        top_apps = app_usage.most_common(10)
+        for i, (app, time) in enumerate(top_apps, 1):
             # Simplify app names
             app_name = app.split('.')[-1] if '.' in app else app
             percentage = (time / total_session_time) * 100 if total_session_time > 0 else 0
             print(f"  {i:2d}. {app_name:20s}: {format_duration(time):>8s} ({percentage:4.1f}%)")
     
     # Deep Focus analysis
-    deep_focus_sessions = []
-    for day in daily_data.values():
-        deep_focus_sessions.extend(day.get('deepFocusSessions', []))
-    
     if deep_focus_sessions:
         total_focus_time = sum(session['duration'] for session in deep_focus_sessions)
         avg_session_length = total_focus_time / len(deep_focus_sessions)
@@ -108,58 +207,60 @@ def analyze_usage_data(data):
         print(f"   Average Session: {format_duration(avg_session_length)}")
     
     # Work pattern analysis
-    continuous_sessions = []
-    for day in daily_data.values():
-        continuous_sessions.extend(day.get('continuousWorkSessions', []))
-    
     if continuous_sessions:
-        longest_session = max(session['duration'] for session in continuous_sessions)
-        avg_session = sum(session['duration'] for session in continuous_sessions) / len(continuous_sessions)
+        durations = [session['duration'] for session in continuous_sessions]
+        longest_session = max(durations)
+        avg_session = sum(durations) / len(durations)
         print(f"\n💪 Work Patterns:")
         print(f"   Continuous Sessions: {len(continuous_sessions)}")
         print(f"   Longest Session: {format_duration(longest_session)}")
         print(f"   Average Session: {format_duration(avg_session)}")
     
     # Weekly patterns
-    if total_days >= 7:
+    if track_weekly:
         print(f"\n📅 Weekly Patterns:")
-        weekly_totals = defaultdict(float)
-        for date_str, day in daily_data.items():
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            weekday = date_obj.strftime('%A')
-            weekly_totals[weekday] += day['totalSessionTime']
-        
         days_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        for day in days_order:
-            if day in weekly_totals:
-                avg_time = weekly_totals[day] / (total_days // 7 + (1 if total_days % 7 > days_order.index(day) else 0))
+        for weekday, day in enumerate(days_order):
+            if weekly_counts[weekday]:
+                avg_time = weekly_totals[weekday] / weekly_counts[weekday]
                 print(f"   {day:9s}: {format_duration(avg_time)}")
 
-def analyze_wellness_data(daily_data):
-    """Analyze wellness and health-related metrics"""
-    print(f"\n🌱 WELLNESS & HEALTH ANALYSIS")
-    print("=" * 50)
-    
+NO_METRICS = {}  # Shared read-only default for days without wellnessMetrics
+INTENSITY_LABELS = {1: 'light', 2: 'moderate', 3: 'intense'}
+MOOD_SCORES = {'productive': 4, 'balanced': 3, 'tired': 2, 'stressed': 1}
+
+def build_wellness_tables(daily_data):
+    """Collect wellness records and per-day summaries in a single pass
+
+    The flat record lists feed analyze_wellness_data and the per-day
+    columns (parallel lists, one entry per day) feed analyze_correlations,
+    so the export is walked only once.
+    """
     mate_records = []
     exercise_records = []
     energy_records = []
     mood_records = []
-    reflection_days = 0
+    daily_columns = {
+        'session_time': [],
+        'mate_total': [],
+        'exercise_done': [],
+        'avg_energy': [],
+        'mood_score': []
+    }
     
-    # Collect wellness data
     for day_data in daily_data.values():
-        wellness = day_data.get('wellnessMetrics', {})
+        wellness = day_data.get('wellnessMetrics') or NO_METRICS
         
-        # Mate/Sugar data
-        mate_data = wellness.get('mateAndSugarRecords', [])
+        # Mate/Sugar data (missing lists fall back to a shared empty tuple)
+        mate_data = wellness.get('mateAndSugarRecords') or ()
         mate_records.extend(mate_data)
         
         # Exercise data
-        exercise_data = wellness.get('exerciseRecords', [])
+        exercise_data = wellness.get('exerciseRecords') or ()
         # Normalize exercise intensity values (support int or string)
         for ex in exercise_data:
             if isinstance(ex.get('intensity'), int):
-                ex['intensityLabel'] = {1: 'light', 2: 'moderate', 3: 'intense'}.get(ex['intensity'], 'none')
+                ex['intensityLabel'] = INTENSITY_LABELS.get(ex['intensity'], 'none')
             else:
                 ex['intensityLabel'] = ex.get('type', 'none')
         exercise_records.extend(exercise_data)
@@ -169,7 +270,7 @@ def analyze_wellness_data(daily_data):
         if raw_energy is None:
             # Map app schema to analyzer expectations
             raw_energy = []
-            for rec in wellness.get('energyLevels', []):
+            for rec in wellness.get('energyLevels') or ():
                 mapped = dict(rec)
                 # Analyzer expects 'energyLevel'
                 mapped['energyLevel'] = rec.get('level', rec.get('energyLevel', 0))
@@ -177,15 +278,40 @@ def analyze_wellness_data(daily_data):
         energy_records.extend(raw_energy)
         
         # Daily reflections live at top-level in app schema
-        if day_data.get('dailyReflection'):
-            reflection_days += 1
-            reflection = day_data['dailyReflection']
+        reflection = day_data.get('dailyReflection') or {}
+        if reflection:
             mood_records.append({
                 'mood': reflection.get('mood', reflection.get('dayType', '')),
                 'energy': reflection.get('energyLevel', 0),
                 'stress': reflection.get('stressLevel', 0),
                 'quality': reflection.get('workQuality', '')
             })
+        
+        # Per-day columns for correlations; map dayType → mood
+        mood_val = reflection.get('mood', reflection.get('dayType', 'balanced'))
+        daily_columns['session_time'].append(day_data.get('totalSessionTime', 0))
+        daily_columns['mate_total'].append(sum(record.get('mateAmount', 0) for record in mate_data))
+        daily_columns['exercise_done'].append(any(record.get('done', False) for record in exercise_data))
+        daily_columns['avg_energy'].append(sum(record.get('energyLevel', 0) for record in raw_energy) / max(len(raw_energy), 1))
+        daily_columns['mood_score'].append(MOOD_SCORES.get(mood_val, 3))
+    
+    return {
+        'mate_records': mate_records,
+        'exercise_records': exercise_records,
+        'energy_records': energy_records,
+        'mood_records': mood_records,
+        'daily_columns': daily_columns
+    }
+
+def analyze_wellness_data(tables):
+    """Analyze wellness and health-related metrics"""
+    print(f"\n🌱 WELLNESS & HEALTH ANALYSIS")
+    print("=" * 50)
+    
+    mate_records = tables['mate_records']
+    exercise_records = tables['exercise_records']
+    energy_records = tables['energy_records']
+    mood_records = tables['mood_records']
     
     # Mate & Sugar Analysis
     if mate_records:
@@ -200,21 +326,22 @@ def analyze_wellness_data(daily_data):
         print(f"   Avg Sugar Level: {avg_sugar_per_check:.1f}")
         
         # Mate reduction tracking
-        daily_mate_totals = {}
+        daily_mate_totals = defaultdict(float)
         for record in mate_records:
-            date = record.get('timestamp', '')[:10]  # Extract date
-            if date:
-                daily_mate_totals[date] = daily_mate_totals.get(date, 0) + record.get('mateAmount', 0)
+            timestamp = record.get('timestamp')
+            if timestamp:
+                daily_mate_totals[timestamp[:10]] += record.get('mateAmount', 0)  # Key by date
         
         if len(daily_mate_totals) > 1:
-            mate_values = list(daily_mate_totals.values())
+            mate_values = [daily_mate_totals[day] for day in sorted(daily_mate_totals)]
             print(f"   Trend: {'📉 Reducing' if mate_values[-1] < mate_values[0] else '📈 Increasing'}")
     
     # Exercise Analysis
     if exercise_records:
         print(f"\n🏃 Exercise Tracking:")
-        exercise_days = sum(1 for record in exercise_records if record.get('done', False))
-        total_duration = sum(record.get('duration', 0) for record in exercise_records if record.get('done', False))
+        completed_durations = [record.get('duration', 0) for record in exercise_records if record.get('done', False)]
+        exercise_days = len(completed_durations)
+        total_duration = sum(completed_durations)
         
         print(f"   Total Reports: {len(exercise_records)}")
         print(f"   Exercise Days: {exercise_days}")
@@ -223,12 +350,12 @@ def analyze_wellness_data(daily_data):
             print(f"   Avg Duration: {total_duration/exercise_days:.0f} minutes")
         
         # Exercise intensity distribution
-        intensity_count = {'none': 0, 'light': 0, 'moderate': 0, 'intense': 0}
+        intensity_count = Counter({'none': 0, 'light': 0, 'moderate': 0, 'intense': 0})
         for record in exercise_records:
             label = record.get('intensityLabel') or record.get('type') or 'none'
             if isinstance(label, str):
                 label = label.lower()
-            intensity_count[label] = intensity_count.get(label, 0) + 1
+            intensity_count[label] += 1
         
         print(f"   Intensity Distribution:")
         for intensity, count in intensity_count.items():
@@ -238,14 +365,19 @@ def analyze_wellness_data(daily_data):
     # Energy Level Analysis
     if energy_records:
         print(f"\n⚡ Energy Level Tracking:")
-        avg_energy = sum(record.get('energyLevel', 0) for record in energy_records) / len(energy_records)
+        energy_levels = [record.get('energyLevel', 0) for record in energy_records]
+        avg_energy = sum(energy_levels) / len(energy_levels)
         print(f"   Total Reports: {len(energy_records)}")
         print(f"   Average Energy: {avg_energy:.1f}/10")
         
         # Energy distribution
-        energy_levels = [record.get('energyLevel', 0) for record in energy_records]
-        low_energy_days = sum(1 for level in energy_levels if level <= 4)
-        high_energy_days = sum(1 for level in energy_levels if level >= 7)
+        low_energy_days = 0
+        high_energy_days = 0
+        for level in energy_levels:
+            if level <= 4:
+                low_energy_days += 1
+            elif level >= 7:
+                high_energy_days += 1
         
         print(f"   Low Energy Days (≤4): {low_energy_days}")
         print(f"   High Energy Days (≥7): {high_energy_days}")
@@ -253,16 +385,14 @@ def analyze_wellness_data(daily_data):
     # Mood & Reflection Analysis
     if mood_records:
         print(f"\n📝 Mood & Reflection Analysis:")
-        print(f"   Reflection Days: {reflection_days}")
+        print(f"   Reflection Days: {len(mood_records)}")
         
         # Mood distribution
-        mood_count = {}
+        mood_count = Counter(record['mood'] for record in mood_records)
         total_energy = 0
         total_stress = 0
         
         for record in mood_records:
-            mood = record['mood']
-            mood_count[mood] = mood_count.get(mood, 0) + 1
             total_energy += record['energy']
             total_stress += record['stress']
         
@@ -277,61 +407,47 @@ def analyze_wellness_data(daily_data):
             print(f"   Average Stress: {avg_stress:.1f}/10")
         
         # Work quality correlation
-        quality_count = {}
-        for record in mood_records:
-            quality = record['quality']
-            quality_count[quality] = quality_count.get(quality, 0) + 1
+        quality_count = Counter(record['quality'] for record in mood_records)
         
         print(f"   Work Quality Distribution:")
         for quality, count in quality_count.items():
             print(f"     {quality.capitalize()}: {count} days")
 
-def analyze_correlations(daily_data):
+def bucket_averages(columns, days):
+    """Average mate, energy and exercise rate (%) over the given day indices in one pass"""
+    mate_total = columns['mate_total']
+    avg_energy = columns['avg_energy']
+    exercise_done = columns['exercise_done']
+    mate_sum = 0
+    energy_sum = 0
+    exercise_sum = 0
+    for i in days:
+        mate_sum += mate_total[i]
+        energy_sum += avg_energy[i]
+        exercise_sum += exercise_done[i]
+    count = len(days)
+    return mate_sum / count, energy_sum / count, exercise_sum / count * 100
+
+def analyze_correlations(tables):
     """Analyze correlations between wellness metrics and productivity"""
     print(f"\n🔗 WELLNESS-PRODUCTIVITY CORRELATIONS")
     print("=" * 50)
     
-    correlations = []
+    columns = tables['daily_columns']
+    session_times = columns['session_time']
+    day_count = len(session_times)
     
-    for day_data in daily_data.values():
-        wellness = day_data.get('wellnessMetrics', {})
-        session_time = day_data.get('totalSessionTime', 0)
+    if day_count >= 3:  # Need at least 3 data points for meaningful analysis
+        print(f"   Analyzed {day_count} days of data:\n")
         
-        # Daily totals
-        mate_total = sum(record.get('mateAmount', 0) for record in wellness.get('mateAndSugarRecords', []))
-        exercise_done = any(record.get('done', False) for record in wellness.get('exerciseRecords', []))
-        # Average energy: support both analyzer and app schema
-        energy_list = wellness.get('energyChecks')
-        if energy_list is None:
-            energy_list = []
-            for rec in wellness.get('energyLevels', []):
-                energy_list.append({'energyLevel': rec.get('level', 0)})
-        avg_energy = sum(record.get('energyLevel', 0) for record in energy_list) / max(len(energy_list), 1)
-        
-        # Reflection at top-level; map dayType → mood
-        reflection = day_data.get('dailyReflection', {})
-        mood_val = reflection.get('mood', reflection.get('dayType', 'balanced'))
-        mood_score = {'productive': 4, 'balanced': 3, 'tired': 2, 'stressed': 1}.get(mood_val, 3)
-        
-        correlations.append({
-            'session_time': session_time,
-            'mate_total': mate_total,
-            'exercise_done': exercise_done,
-            'avg_energy': avg_energy,
-            'mood_score': mood_score
-        })
-    
-    if len(correlations) >= 3:  # Need at least 3 data points for meaningful analysis
-        print(f"   Analyzed {len(correlations)} days of data:\n")
-        
-        # Simple correlation insights
-        high_productivity_days = [day for day in correlations if day['session_time'] > sum(d['session_time'] for d in correlations) / len(correlations)]
-        low_productivity_days = [day for day in correlations if day['session_time'] < sum(d['session_time'] for d in correlations) / len(correlations) * 0.7]
+        # Simple correlation insights (lists of day indices into the columns)
+        mean_session_time = sum(session_times) / day_count
+        high_productivity_days = [i for i, session_time in enumerate(session_times) if session_time > mean_session_time]
+        low_threshold = mean_session_time * 0.7
+        low_productivity_days = [i for i, session_time in enumerate(session_times) if session_time < low_threshold]
         
         if high_productivity_days:
-            avg_mate_high = sum(day['mate_total'] for day in high_productivity_days) / len(high_productivity_days)
-            avg_energy_high = sum(day['avg_energy'] for day in high_productivity_days) / len(high_productivity_days)
-            exercise_rate_high = sum(day['exercise_done'] for day in high_productivity_days) / len(high_productivity_days) * 100
+            avg_mate_high, avg_energy_high, exercise_rate_high = bucket_averages(columns, high_productivity_days)
             
             print(f"   📈 High Productivity Days ({len(high_productivity_days)} days):")
             print(f"      Average Mate Consumption: {avg_mate_high:.1f}")
@@ -339,9 +455,7 @@ def analyze_correlations(daily_data):
             print(f"      Exercise Rate: {exercise_rate_high:.0f}%")
         
         if low_productivity_days:
-            avg_mate_low = sum(day['mate_total'] for day in low_productivity_days) / len(low_productivity_days)
-            avg_energy_low = sum(day['avg_energy'] for day in low_productivity_days) / len(low_productivity_days)
-            exercise_rate_low = sum(day['exercise_done'] for day in low_productivity_days) / len(low_productivity_days) * 100
+            avg_mate_low, avg_energy_low, exercise_rate_low = bucket_averages(columns, low_productivity_days)
             
             print(f"\n   📉 Low Productivity Days ({len(low_productivity_days)} days):")
             print(f"      Average Mate Consumption: {avg_mate_low:.1f}")
@@ -371,34 +485,27 @@ def main():
     args = parser.parse_args()
     
     try:
-        with open(args.file, 'r') as f:
-            data = json.load(f)
-        
-        daily_data = data.get('dailyData', {})
-        
-        # Filter by days if specified
+        # Filter by days if specified (today counts as the last day)
         if args.days:
-            from datetime import datetime, timedelta
-            cutoff_date = datetime.now() - timedelta(days=args.days)
-            filtered_daily_data = {
-                date_str: day_data for date_str, day_data in daily_data.items()
-                if datetime.strptime(date_str, '%Y-%m-%d') >= cutoff_date
-            }
-            data['dailyData'] = filtered_daily_data
-            daily_data = filtered_daily_data
-            print(f"📅 Analyzing last {args.days} days ({len(filtered_daily_data)} days of data)")
+            since = (date.today() - timedelta(days=args.days - 1)).isoformat()
+            daily_data = load_recent_days(args.file, since)
+            data = {'dailyData': daily_data}
+            print(f"📅 Analyzing last {args.days} days ({len(daily_data)} days of data)")
+        else:
+            data = load_export(args.file)
+            daily_data = data.get('dailyData', {})
         
         has_wellness_data = any(day.get('wellnessMetrics') for day in daily_data.values())
         
         # Run specific analysis based on arguments
         if args.wellness_only:
             if has_wellness_data:
-                analyze_wellness_data(daily_data)
+                analyze_wellness_data(build_wellness_tables(daily_data))
             else:
                 print(f"🌱 No wellness data found in export.")
         elif args.correlations:
             if has_wellness_data:
-                analyze_correlations(daily_data)
+                analyze_correlations(build_wellness_tables(daily_data))
             else:
                 print(f"🔗 No wellness data found for correlation analysis.")
         else:
@@ -406,15 +513,16 @@ def main():
             analyze_usage_data(data)
             
             if has_wellness_data:
-                analyze_wellness_data(daily_data)
-                analyze_correlations(daily_data)
+                wellness_tables = build_wellness_tables(daily_data)
+                analyze_wellness_data(wellness_tables)
+                analyze_correlations(wellness_tables)
             else:
                 print(f"\n🌱 No wellness data found in export. Start using the wellness features to see analysis here!")
         
     except FileNotFoundError:
         print(f"Error: File '{args.file}' not found.")
         sys.exit(1)
-    except json.JSONDecodeError:
+    except INVALID_JSON_ERRORS:
         print(f"Error: Invalid JSON file '{args.file}'.")
         sys.exit(1)
     except Exception as e: